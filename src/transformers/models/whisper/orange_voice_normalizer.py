@@ -5,9 +5,180 @@
 import re
 import unicodedata
 from collections.abc import Iterator
-from typing import List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from .english_normalizer import remove_symbols_and_diacritics
+
+# The lookup tables never change, so they live at module scope and are shared
+# by every instance instead of being rebuilt in each __init__
+
+# Wolof number system (base-5)
+_WOLOF_ZEROS = frozenset({"tus"})
+
+# Basic numbers 1-5 (with alternative forms)
+_WOLOF_BASIC = {
+    "benn": 1, "ñaar": 2, "ñett": 3, "ñent": 4, "juróom": 5,
+    "ñaari": 2, "ñetti": 3, "ñenti": 4, "juróomi": 5,
+    "benni": 1
+}
+
+_WOLOF_TEN = {"fukk": 10}
+_WOLOF_HUNDRED = {"téeméer": 100}
+_WOLOF_THOUSAND = {"junni": 1000}
+
+# Special thirty
+_WOLOF_SPECIAL = {"fanweer": 30}
+
+# Large numbers
+_WOLOF_LARGE = {
+    "fukki junni": 10000,
+    "téeméeri junni": 100000,
+    "tamndareet": 1000000,
+    "million": 1000000,
+    "tamñareet": 1000000000,
+    "miliyard": 1000000000,
+    "milliard": 1000000000
+}
+
+# French numbers
+_FRENCH_ONES = {
+    "zéro": 0, "zero": 0, "un": 1, "une": 1, "deux": 2, "trois": 3,
+    "quatre": 4, "cinq": 5, "six": 6, "sept": 7, "huit": 8, "neuf": 9,
+    "dix": 10, "onze": 11, "douze": 12, "treize": 13, "quatorze": 14,
+    "quinze": 15, "seize": 16, "dix-sept": 17, "dix-huit": 18, "dix-neuf": 19
+}
+
+_FRENCH_TENS = {
+    "vingt": 20, "trente": 30, "quarante": 40, "cinquante": 50,
+    "soixante": 60, "soixante-dix": 70, "quatre-vingts": 80,
+    "quatre-vingt": 80, "quatre-vingt-dix": 90
+}
+
+_FRENCH_MULTIPLIERS = {
+    "cent": 100, "cents": 100, "mille": 1000,
+    "million": 1000000, "millions": 1000000,
+    "milliard": 1000000000, "milliards": 1000000000
+}
+
+# All single number words in one dict, so the fallback lookup in
+# convert_to_number is a single probe instead of a chain of membership tests
+_ALL_NUMWORDS = {
+    **_WOLOF_BASIC, **_WOLOF_TEN, **_WOLOF_HUNDRED, **_WOLOF_THOUSAND,
+    **_WOLOF_SPECIAL, **_FRENCH_ONES, **_FRENCH_TENS, **_FRENCH_MULTIPLIERS
+}
+
+# The same table with the values pre-stringified, saving an int->str
+# conversion every time a known word is emitted; arithmetic paths keep using
+# the int dicts
+_ALL_NUMWORDS_STR = {word: str(value) for word, value in _ALL_NUMWORDS.items()}
+
+# Special connectors
+_CONNECTORS = frozenset({"ak", "et", "you", "manqué"})
+
+# Service words to remove in codes
+_SERVICE_WORDS = frozenset({"tapez", "composer", "appuyez", "sur"})
+
+# Orange patterns
+_CODE_MARKERS = ("dièse", "diese", "hash", "#", "étoile", "star", "*")
+_DATA_UNITS = ("go", "mo", "giga", "mega", "gigaoctets", "megaoctets")
+_CURRENCY_MARKERS = ("fcfa", "francs cfa", "francs", "f")
+
+# Marker word classes used by the single-pass scanner: one spelling->symbol
+# table decides both which words open a code and which symbol they emit
+_CODE_SYMBOL = {
+    "dièse": "#", "diese": "#", "hash": "#",
+    "étoile": "*", "star": "*",
+}
+_MARKER_WORDS = frozenset(_CODE_SYMBOL)
+_DATA_UNIT_WORDS = frozenset({
+    "go", "mo", "giga", "mega",
+    "gigaoctet", "gigaoctets", "megaoctet", "megaoctets"
+})
+
+# Phone-collector tables: one dict probe maps a French number word straight to
+# its digit string, and one frozenset answers "part of a spoken phone number?"
+# (number words plus the fillers 'cent'/'et'/'-' that are skipped uncounted)
+_PHONE_DIGIT = {word: str(value) for word, value in {**_FRENCH_ONES, **_FRENCH_TENS}.items()}
+_PHONE_VOCAB = frozenset(_PHONE_DIGIT) | {"cent", "et", "-"}
+
+# Precompiled patterns (the patterns never change, so compile them once here
+# instead of re-parsing them on every call)
+# Lowercase units: the pipeline lowercases before scanning, so pre-formatted
+# tokens like '5Go' arrive as '5go'; the handler re-emits the canonical casing
+_DIGIT_UNIT_RE = re.compile(r'\d(go|mo)$')
+
+# A run of 6+ words that could spell out a phone number (French number words,
+# digits, or the fillers 'cent'/'et'/'-'). The C-level regex engine finds the
+# candidate spans; the Python-level collector only runs inside a match. Each
+# word must start after whitespace and end before whitespace so compounds like
+# 'trente-deux' are never split.
+_PHONE_SEQ_RE = re.compile(
+    r'(?<!\S)(?:(?:\b(?:'
+    + '|'.join(map(re.escape, sorted({**_FRENCH_ONES, **_FRENCH_TENS}, key=len, reverse=True)))
+    + r'|\d+|cent|et)|-)(?=\s|$)\s*){6,}'
+)
+
+
+def _build_num_trie() -> dict:
+    """
+    Build a prefix trie of nested dicts over the Wolof number-word sequences.
+    A "__val__" key marks the end of a known sequence and holds its numeric
+    value, so matching a multi-word number is one walk through the trie
+    instead of a ladder of chained comparisons.
+    """
+    trie = {}
+
+    def add(sequence, value):
+        node = trie
+        for word in sequence:
+            node = node.setdefault(word, {})
+        node["__val__"] = value
+        # Pre-stringified value, so emitting a match needs no str() call
+        node["__str__"] = str(value)
+
+    for word, value in _WOLOF_BASIC.items():
+        add((word,), value)
+        # "X fukk" (X×10), "X téeméer" (X×100), "X junni" (X×1000)
+        add((word, "fukk"), value * 10)
+        add((word, "téeméer"), value * 100)
+        add((word, "junni"), value * 1000)
+        # "juróom X" (5+X)
+        add(("juróom", word), 5 + value)
+    add(("fukk",), 10)
+    add(("téeméer",), 100)
+    add(("junni",), 1000)
+    add(("fanweer",), 30)
+    return trie
+
+
+# Prefix trie over Wolof number-word sequences (longest match wins)
+_NUM_TRIE = _build_num_trie()
+
+
+@lru_cache(maxsize=1)
+def _diacritic_table() -> dict:
+    """
+    Translation table deleting combining marks, built once on first use.
+    Walking the BMP with unicodedata.category is slow, so the result is
+    cached and str.translate then strips marks in a single C pass.
+    """
+    return {
+        cp: None
+        for cp in range(0x10000)
+        if unicodedata.category(chr(cp)) == 'Mn'
+    }
+
+
+def remove_diacritics(text: str) -> str:
+    """
+    Strip diacritics: NFKD-decompose, then delete the combining marks via
+    str.translate. Offered as a utility for callers cleaning noisy ASR
+    output; the normalization pipeline itself does not apply it because the
+    Wolof and marker vocabularies are diacritic-sensitive ("téeméer",
+    "dièse" vs "diese" are distinct entries).
+    """
+    return unicodedata.normalize("NFKD", text).translate(_diacritic_table())
 
 
 class SenegalVoiceNormalizer:
@@ -17,113 +188,257 @@ class SenegalVoiceNormalizer:
     - French numbers
     - Mixed Wolof/French content
     - Orange telecom patterns (codes, data, phone numbers, prices)
+
+    All lookup tables are module-level constants, so constructing an instance
+    is free and the tables are shared across instances. The class-level
+    aliases below keep the historical attribute names working.
     """
-    
-    def __init__(self):
-        # Wolof number system (base-5)
-        self.wolof_zeros = {"tus"}
-        
-        # Basic numbers 1-5
-        self.wolof_basic = {
-            "benn": 1, "ñaar": 2, "ñett": 3, "ñent": 4, "juróom": 5,
-            # Alternative forms
-            "ñaari": 2, "ñetti": 3, "ñenti": 4, "juróomi": 5,
-            "benni": 1
-        }
-        
-        # Ten
-        self.wolof_ten = {"fukk": 10}
-        
-        # Hundreds
-        self.wolof_hundred = {"téeméer": 100}
-        
-        # Thousands
-        self.wolof_thousand = {"junni": 1000}
-        
-        # Special thirty
-        self.wolof_special = {"fanweer": 30}
-        
-        # Large numbers
-        self.wolof_large = {
-            "fukki junni": 10000,
-            "téeméeri junni": 100000,
-            "tamndareet": 1000000,
-            "million": 1000000,
-            "tamñareet": 1000000000,
-            "miliyard": 1000000000,
-            "milliard": 1000000000
-        }
-        
-        # French numbers
-        self.french_ones = {
-            "zéro": 0, "zero": 0, "un": 1, "une": 1, "deux": 2, "trois": 3,
-            "quatre": 4, "cinq": 5, "six": 6, "sept": 7, "huit": 8, "neuf": 9,
-            "dix": 10, "onze": 11, "douze": 12, "treize": 13, "quatorze": 14,
-            "quinze": 15, "seize": 16, "dix-sept": 17, "dix-huit": 18, "dix-neuf": 19
-        }
-        
-        self.french_tens = {
-            "vingt": 20, "trente": 30, "quarante": 40, "cinquante": 50,
-            "soixante": 60, "soixante-dix": 70, "quatre-vingts": 80,
-            "quatre-vingt": 80, "quatre-vingt-dix": 90
-        }
-        
-        self.french_multipliers = {
-            "cent": 100, "cents": 100, "mille": 1000,
-            "million": 1000000, "millions": 1000000,
-            "milliard": 1000000000, "milliards": 1000000000
-        }
-        
-        # Special connectors
-        self.connectors = {"ak", "et", "you", "manqué"}
-        
-        # Service words to remove in codes
-        self.service_words = {"tapez", "composer", "appuyez", "sur"}
-        
-        # Orange patterns
-        self.code_markers = ["dièse", "diese", "hash", "#", "étoile", "star", "*"]
-        self.data_units = ["go", "mo", "giga", "mega", "gigaoctets", "megaoctets"]
-        self.currency_markers = ["fcfa", "francs cfa", "francs", "f"]
+
+    wolof_zeros = _WOLOF_ZEROS
+    wolof_basic = _WOLOF_BASIC
+    wolof_ten = _WOLOF_TEN
+    wolof_hundred = _WOLOF_HUNDRED
+    wolof_thousand = _WOLOF_THOUSAND
+    wolof_special = _WOLOF_SPECIAL
+    wolof_large = _WOLOF_LARGE
+    french_ones = _FRENCH_ONES
+    french_tens = _FRENCH_TENS
+    french_multipliers = _FRENCH_MULTIPLIERS
+    connectors = _CONNECTORS
+    service_words = _SERVICE_WORDS
+    code_markers = _CODE_MARKERS
+    data_units = _DATA_UNITS
+    currency_markers = _CURRENCY_MARKERS
+
+    def _scan(self, text: str, handlers: Optional[Tuple] = None) -> Iterator[str]:
+        """
+        Single left-to-right pass over the words of `text`, yielding normalized
+        tokens. Each handler looks at the current position (plus lookahead) and
+        either consumes a span, returning `(token, next_index)`, or declines
+        with `None`. Handlers are tried in the same priority order as the old
+        multi-pass pipeline: codes, data quantities, currency. The text is
+        expected to be lowercase already (``__call__`` lowercases once).
+        """
+        words = text.split()
+        if handlers is None:
+            handlers = (
+                self._skip_service_words,
+                self._handle_code,
+                self._handle_data,
+                self._handle_currency,
+                self._handle_per_month,
+            )
+
+        i = 0
+        n = len(words)
+        while i < n:
+            for handler in handlers:
+                handled = handler(words, i)
+                if handled is not None:
+                    token, i = handled
+                    if token:
+                        yield token
+                    break
+            else:
+                # No handler claimed this word, pass it through
+                yield words[i]
+                i += 1
+
+    def _skip_service_words(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Drop a run of service words ('tapez', 'composer', ...) before a code marker"""
+        j = i
+        while j < len(words) and words[j] in _SERVICE_WORDS:
+            j += 1
+        if j > i and j < len(words) and words[j] in _MARKER_WORDS:
+            return '', j
+        return None
+
+    def _handle_code(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Normalize service codes like 'dièse 205 dièse' -> '#205#'"""
+        symbol = _CODE_SYMBOL.get(words[i])
+        if symbol is None:
+            return None
+
+        # Find the nearest closing marker with at least one word in between;
+        # any spelling of the same symbol closes the code
+        for k in range(i + 2, len(words)):
+            if _CODE_SYMBOL.get(words[k]) == symbol:
+                # Process the content to convert number words
+                normalized = self._convert_words(words[i + 1:k])
+                return f"{symbol}{normalized}{symbol}", k + 1
+        return None
+
+    def _handle_phone(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Detect and format phone numbers (only French spoken)"""
+        phone_parts = []
+        j = i
+
+        # Collect potential phone number parts (only French numbers)
+        while j < len(words) and len(phone_parts) < 12:
+            word = words[j]
+            # Convert word to number if possible
+            if word.isdigit():
+                phone_parts.append(word)
+            elif word in _PHONE_VOCAB:
+                digit = _PHONE_DIGIT.get(word)
+                if digit is not None:
+                    phone_parts.append(digit)
+                # 'cent' and the connectors 'et'/'-' are skipped uncounted
+            else:
+                # Not a phone number part
+                break
+            j += 1
+
+        # Check if we have a potential phone number (6-10 parts)
+        if len(phone_parts) >= 6:
+            # Convert to single digits where needed
+            digits = []
+            for part in phone_parts:
+                if len(part) == 1 or (len(part) == 2 and part[0] in "789"):
+                    digits.append(part)
+                else:
+                    # Not a phone digit pattern
+                    break
+
+            # Check if we have 8 or 9 digits
+            digit_str = ''.join(digits)
+            if len(digit_str) in [8, 9]:
+                # Format as phone number
+                if len(digit_str) == 9:
+                    formatted = f"{digit_str[0:2]} {digit_str[2:5]} {digit_str[5:7]} {digit_str[7:9]}"
+                else:
+                    formatted = f"{digit_str[0:2]} {digit_str[2:5]} {digit_str[5:8]}"
+                return formatted, j
+
+        return None
+
+    def _handle_data(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Normalize data quantities like 'cinq giga' -> '5Go'"""
+        # Look ahead for a data unit following a quantity
+        for u in range(i + 1, min(i + 6, len(words))):
+            unit = words[u]
+            if unit not in _DATA_UNIT_WORDS:
+                continue
+
+            # Convert quantity to number
+            normalized_qty = self._convert_words(words[i:u])
+
+            # Standardize unit
+            if unit in ['go', 'giga', 'gigaoctets', 'gigaoctet']:
+                unit = 'Go'
+            elif unit in ['mo', 'mega', 'megaoctets', 'megaoctet']:
+                unit = 'Mo'
+
+            token = f"{normalized_qty}{unit}"
+            next_i = u + 1
+            # Handle per month patterns
+            if normalized_qty and normalized_qty[-1].isdigit():
+                token, next_i = self._fuse_per_month(words, next_i, token)
+            return token, next_i
+        return None
+
+    def _handle_per_month(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Attach 'par mois' / '/ mois' to an already formatted data quantity"""
+        match = _DIGIT_UNIT_RE.search(words[i])
+        if match:
+            # Restore the canonical 'Go'/'Mo' casing lost to the lowercase
+            # pass, with or without a following 'par mois' to fuse, so
+            # pre-formatted tokens round-trip through the pipeline unchanged
+            unit = match.group(1).capitalize()
+            return self._fuse_per_month(words, i + 1, words[i][:match.start(1)] + unit)
+        return None
+
+    def _fuse_per_month(self, words: List[str], i: int, token: str) -> Tuple[str, int]:
+        """Consume a following 'par mois' (or '/ mois') and fuse it into `token`"""
+        if i < len(words):
+            if words[i] == '/mois':
+                return f"{token}/mois", i + 1
+            if words[i] in ('par', '/') and i + 1 < len(words) and words[i + 1] == 'mois':
+                return f"{token}/mois", i + 2
+        return token, i
+
+    def _handle_currency(self, words: List[str], i: int) -> Optional[Tuple[str, int]]:
+        """Normalize currency amounts like 'vingt mille francs' -> '20 000 F'"""
+        if i >= len(words) - 1:
+            return None
+
+        # Look ahead for currency markers
+        currency_idx = -1
+        currency_type = ""
+
+        # Check next few words for currency markers
+        for j in range(i + 1, min(i + 6, len(words))):
+            if words[j] in ["francs", "franc", "f"]:
+                currency_idx = j
+                currency_type = "F"
+                break
+            elif words[j] == "fcfa":
+                currency_idx = j
+                currency_type = "FCFA"
+                break
+
+        if currency_idx < 0:
+            return None
+
+        # Extract the amount part and convert it to a number
+        normalized = self._convert_currency_amount(words[i:currency_idx])
+
+        # Format large numbers
+        if normalized.isdigit() and len(normalized) >= 4:
+            normalized = self._format_with_spaces(normalized)
+        return f"{normalized} {currency_type}", currency_idx + 1
+
+    def _convert_currency_amount(self, amount_words: List[str]) -> str:
+        """Convert a currency amount to digits, with special handling for dërëm"""
+        if len(amount_words) > 1 and amount_words[-1] == "dërëm":
+            # Special handling for dërëm (1 dërëm = 5 FCFA): convert the
+            # number before it and multiply
+            base_num = self._convert_words(amount_words[:-1])
+            if base_num.isdigit():
+                return str(int(base_num) * 5)
+            return ' '.join(amount_words)
+        return self._convert_words(amount_words)
 
     def normalize_codes(self, text: str) -> str:
         """Normalize service codes like 'tapez dièse 205 dièse' -> '#205#'"""
-        # Remove service words before code patterns
-        for word in self.service_words:
-            text = re.sub(rf'\b{word}\s+(?=(dièse|diese|hash|étoile|star))', '', text, flags=re.IGNORECASE)
-        
-        # Pattern for codes with markers
-        patterns = [
-            (r'\b(dièse|diese|hash)\s+(.*?)\s+(dièse|diese|hash)\b', '#'),
-            (r'\b(étoile|star)\s+(.*?)\s+(étoile|star)\b', '*'),
-        ]
-        
-        for pattern, symbol in patterns:
-            def replace_code(match):
-                content = match.group(2)
-                # Process the content to convert number words
-                normalized = self.convert_to_number(content)
-                return f"{symbol}{normalized}{symbol}"
-            
-            text = re.sub(pattern, replace_code, text, flags=re.IGNORECASE)
-        
-        return text
-
-    def convert_to_number(self, text: str) -> str:
-        """Convert number words to digits, handling both Wolof and French"""
-        words = text.lower().split()
-        result = []
+        # The handlers expect lowercase; __call__ lowercases up front, but
+        # these stage entry points are public and must accept any case
+        text = text.lower()
+        return ' '.join(self._scan(text, (self._skip_service_words, self._handle_code)))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def convert_to_number(text: str) -> str:
+        """
+        Convert number words to digits, handling both Wolof and French.
+
+        Voice-menu phrases repeat a lot ("cinq giga", "cinquante mille", ...),
+        so results are memoized. Callers that already hold a word list use
+        `_convert_words` directly and skip the join/split round-trip.
+        """
+        # Already-digit input has nothing to convert; return it untouched
+        # instead of walking the word machinery
+        if text.replace(' ', '').isdigit():
+            return text.strip()
+        return SenegalVoiceNormalizer._convert_words(text.lower().split())
+
+    @staticmethod
+    def _convert_words(words: List[str]) -> str:
+        """Convert a list of words to digits; list-taking core of convert_to_number"""
+        # Every iteration emits at most one part, so a preallocated list with
+        # a running write index avoids the append/resize churn
+        result = [None] * len(words)
+        k = 0
         i = 0
-        
+
         while i < len(words):
             # Handle hyphenated French numbers
             if '-' in words[i]:
-                # Check if it's a compound French number
-                if words[i] in self.french_tens:
-                    result.append(str(self.french_tens[words[i]]))
-                    i += 1
-                    continue
-                elif words[i] in self.french_ones:
-                    result.append(str(self.french_ones[words[i]]))
+                # Check if it's a known compound French number
+                value_str = _ALL_NUMWORDS_STR.get(words[i])
+                if value_str is not None:
+                    result[k] = value_str
+                    k += 1
                     i += 1
                     continue
                 else:
@@ -132,406 +447,213 @@ class SenegalVoiceNormalizer:
                     if len(parts) == 3 and parts[0] == "quatre" and parts[1] == "vingt":
                         # quatre-vingt-X
                         base = 80
-                        if parts[2] in self.french_ones:
-                            result.append(str(base + self.french_ones[parts[2]]))
+                        if parts[2] in _FRENCH_ONES:
+                            result[k] = str(base + _FRENCH_ONES[parts[2]])
                         else:
-                            result.append(str(base))
+                            result[k] = str(base)
+                        k += 1
                         i += 1
                         continue
                     elif len(parts) == 2:
                         # Regular hyphenated number
                         total = 0
                         for part in parts:
-                            if part in self.french_ones:
-                                total += self.french_ones[part]
-                            elif part in self.french_tens:
-                                total += self.french_tens[part]
+                            if part in _FRENCH_ONES:
+                                total += _FRENCH_ONES[part]
+                            elif part in _FRENCH_TENS:
+                                total += _FRENCH_TENS[part]
                         if total > 0:
-                            result.append(str(total))
+                            result[k] = str(total)
+                            k += 1
                             i += 1
                             continue
-            
+
             # Check if already a number
             if words[i].isdigit():
-                result.append(words[i])
+                result[k] = words[i]
+                k += 1
                 i += 1
                 continue
-            
-            # Try to match multi-word patterns (Wolof)
-            matched = False
-            
-            # Check for "juróom X" patterns (5+X)
-            if words[i] == "juróom" and i + 1 < len(words):
-                if words[i+1] in self.wolof_basic:
-                    value = 5 + self.wolof_basic[words[i+1]]
-                    result.append(str(value))
-                    i += 2
-                    matched = True
-                    continue
-            
-            # Check for "X fukk" patterns (X×10)
-            if i + 1 < len(words) and words[i+1] == "fukk":
-                if words[i] in self.wolof_basic:
-                    value = self.wolof_basic[words[i]] * 10
-                    result.append(str(value))
-                    i += 2
-                    matched = True
-                    continue
-                elif words[i] == "juróom":
-                    # Check for "juróom X fukk" (5+X)×10
-                    if i + 2 < len(words) and words[i+2] == "fukk":
-                        i += 1  # Skip juróom
-                        if words[i] in self.wolof_basic:
-                            value = (5 + self.wolof_basic[words[i]]) * 10
-                            result.append(str(value))
-                            i += 2
-                            matched = True
-                            continue
-            
-            # Check for "X téeméer" patterns (X×100)
-            if i + 1 < len(words) and words[i+1] == "téeméer":
-                if words[i] in self.wolof_basic:
-                    value = self.wolof_basic[words[i]] * 100
-                    result.append(str(value))
-                    i += 2
-                    matched = True
-                    continue
-                elif words[i] == "juróom":
-                    # Check for "juróom X téeméer" (5+X)×100
-                    if i + 2 < len(words) and words[i+2] == "téeméer":
-                        i += 1  # Skip juróom
-                        if words[i] in self.wolof_basic:
-                            value = (5 + self.wolof_basic[words[i]]) * 100
-                            result.append(str(value))
-                            i += 2
-                            matched = True
-                            continue
-            
-            # Check for "X junni" patterns - BUT NOT for standalone "fukk junni" or "ñaar fukk junni"
-            if i + 1 < len(words) and words[i+1] == "junni":
-                # For "ñaar fukk junni", we should have already processed "ñaar fukk" as 20
-                # So don't process "fukk junni" separately
-                if words[i] in self.wolof_basic and not (i > 0 and result and result[-1] == "20"):
-                    value = self.wolof_basic[words[i]] * 1000
-                    result.append(str(value))
-                    i += 2
-                    matched = True
-                    continue
-            
-            if matched:
+
+            # Longest match over the Wolof number trie
+            node = _NUM_TRIE
+            best_str = None
+            best_len = 0
+            depth = 0
+            while i + depth < len(words):
+                node = node.get(words[i + depth])
+                if node is None:
+                    break
+                depth += 1
+                if "__str__" in node:
+                    best_str = node["__str__"]
+                    best_len = depth
+
+            if best_str is not None:
+                # "X junni" right after a tens value keeps X and junni as
+                # separate parts ("ñaar fukk junni" is 20 × 1000, not 20 then
+                # X×1000), so demote the two-word match to the single word
+                if best_len == 2 and words[i + 1] == "junni" and k and result[k - 1] == "20":
+                    best_str = _ALL_NUMWORDS_STR[words[i]]
+                    best_len = 1
+                result[k] = best_str
+                k += 1
+                i += best_len
                 continue
-            
+
             # Check single word conversions
-            if words[i] in self.wolof_basic:
-                result.append(str(self.wolof_basic[words[i]]))
-            elif words[i] in self.wolof_ten:
-                result.append(str(self.wolof_ten[words[i]]))
-            elif words[i] in self.wolof_hundred:
-                result.append(str(self.wolof_hundred[words[i]]))
-            elif words[i] in self.wolof_thousand:
-                result.append(str(self.wolof_thousand[words[i]]))
-            elif words[i] in self.wolof_special:
-                result.append(str(self.wolof_special[words[i]]))
-            elif words[i] in self.french_ones:
-                result.append(str(self.french_ones[words[i]]))
-            elif words[i] in self.french_tens:
-                result.append(str(self.french_tens[words[i]]))
-            elif words[i] in self.french_multipliers:
-                result.append(str(self.french_multipliers[words[i]]))
-            elif words[i] == "dërëm":
-                result.append("dërëm")
-            elif words[i] in self.connectors:
-                result.append(words[i])
+            value_str = _ALL_NUMWORDS_STR.get(words[i])
+            if value_str is not None:
+                result[k] = value_str
             else:
-                result.append(words[i])
-            
+                # Connectors, dërëm and unknown words all pass through as-is
+                result[k] = words[i]
+
+            k += 1
             i += 1
-        
+
         # Now calculate the final number
-        return self.calculate_from_parts(result)
+        return SenegalVoiceNormalizer.calculate_from_parts(result[:k])
 
-    def calculate_from_parts(self, parts: List[str]) -> str:
+    @staticmethod
+    def calculate_from_parts(parts: List[str]) -> str:
         """Calculate the final number from parts, handling 'ak' and multiplication"""
-        # First handle 'ak' (addition)
-        while "ak" in parts:
-            idx = parts.index("ak")
-            if idx > 0 and idx < len(parts) - 1:
-                left = parts[idx-1]
-                right = parts[idx+1]
-                if left.isdigit() and right.isdigit():
-                    sum_val = int(left) + int(right)
-                    parts = parts[:idx-1] + [str(sum_val)] + parts[idx+2:]
+        # Parse every digit part exactly once: values[i] holds the int value of
+        # parts[i] or None for non-numeric words, so the pass below tests
+        # `is not None` instead of re-running isdigit()/int() on the same bytes
+        values = [int(part) if part.isdigit() else None for part in parts]
+
+        # One index-only pass handles 'ak' folding, dërëm multiplication and
+        # number/word separation without building intermediate merged lists.
+        # last_was_number tracks whether numbers[-1] is still a plain numeric
+        # run: dërëm and stray words break it, so 'ak' only folds when it
+        # directly extends a number (chains like '1 ak 2 ak 3' keep cascading
+        # because a fold leaves the run numeric).
+        # Both output lists are bounded by len(parts), so preallocate them and
+        # write through running indexes instead of appending
+        n = len(parts)
+        numbers = [None] * n
+        other_words = [None] * n
+        num_k = 0
+        word_k = 0
+        last_was_number = False
+        i = 0
+        while i < n:
+            value = values[i]
+            if value is not None:
+                numbers[num_k] = value
+                num_k += 1
+                last_was_number = True
+                i += 1
+            elif parts[i] == "ak":
+                if last_was_number and i + 1 < n and values[i + 1] is not None:
+                    # Fold 'X ak Y' into X+Y
+                    numbers[num_k - 1] += values[i + 1]
+                    i += 2
                 else:
-                    parts.remove("ak")
-            else:
-                parts.remove("ak")
-        
-        # Now handle multiplication and combination
-        numbers = []
-        other_words = []
-        
-        for part in parts:
-            if part.isdigit():
-                numbers.append(int(part))
-            elif part == "dërëm" and numbers:
+                    # 'ak' without digits on both sides is just dropped
+                    i += 1
+            elif parts[i] == "dërëm" and num_k:
                 # Multiply last number by 5
-                numbers[-1] = numbers[-1] * 5
+                numbers[num_k - 1] = numbers[num_k - 1] * 5
+                last_was_number = False
+                i += 1
             else:
-                other_words.append(part)
-        
-        if not numbers:
-            return ' '.join(parts)
-        
-        # Combine numbers based on French/Wolof rules
-        result_numbers = []
+                other_words[word_k] = parts[i]
+                last_was_number = False
+                word_k += 1
+                i += 1
+
+        if not num_k:
+            return ' '.join(other_words[:word_k])
+
+        # Combine numbers based on French/Wolof rules; the combined values are
+        # only ever summed, so accumulate the total directly
+        total = 0
         i = 0
-        
-        while i < len(numbers):
+
+        while i < num_k:
             current = numbers[i]
-            
+
             # Look ahead for multipliers
-            if i + 1 < len(numbers):
+            if i + 1 < num_k:
                 next_num = numbers[i + 1]
                 # Check if next number is a multiplier (100, 1000, etc.)
                 if next_num >= 100 and current < next_num:
                     # Multiply current by next
-                    result_numbers.append(current * next_num)
+                    total += current * next_num
                     i += 2
                     continue
-            
+
             # No multiplication, just add the number
-            result_numbers.append(current)
+            total += current
             i += 1
-        
-        # Sum all the result numbers
-        total = sum(result_numbers)
-        
+
         # If we have other words, return them with the number
-        if other_words:
-            return str(total) + ' ' + ' '.join(other_words)
-        
+        if word_k:
+            return str(total) + ' ' + ' '.join(other_words[:word_k])
+
         return str(total)
 
     def normalize_phone_numbers(self, text: str) -> str:
         """Detect and format phone numbers (only French spoken)"""
-        words = text.split()
+        return _PHONE_SEQ_RE.sub(self._phone_repl, text)
+
+    def _phone_repl(self, match) -> str:
+        """Run the phone collector over a candidate span found by _PHONE_SEQ_RE"""
+        span = match.group(0)
+        stripped = span.rstrip()
+        words = stripped.split()
         result = []
         i = 0
-        
         while i < len(words):
-            # Look for sequences that could be phone numbers
-            phone_parts = []
-            j = i
-            
-            # Collect potential phone number parts (only French numbers)
-            while j < len(words) and len(phone_parts) < 12:
-                word = words[j]
-                # Convert word to number if possible
-                if word.isdigit():
-                    phone_parts.append(word)
-                elif word in self.french_ones:
-                    phone_parts.append(str(self.french_ones[word]))
-                elif word in self.french_tens:
-                    phone_parts.append(str(self.french_tens[word]))
-                elif word == "cent":
-                    # Skip "cent" in phone number context
-                    j += 1
-                    continue
-                elif word in ["et", "-"]:
-                    # Skip connectors in phone context
-                    j += 1
-                    continue
-                else:
-                    # Not a phone number part
-                    break
-                j += 1
-            
-            # Check if we have a potential phone number (6-10 parts)
-            if len(phone_parts) >= 6:
-                # Convert to single digits where needed
-                digits = []
-                for part in phone_parts:
-                    if len(part) == 1 or (len(part) == 2 and part[0] in "789"):
-                        digits.append(part)
-                    else:
-                        # Not a phone digit pattern
-                        break
-                
-                # Check if we have 8 or 9 digits
-                digit_str = ''.join(digits)
-                if len(digit_str) in [8, 9]:
-                    # Format as phone number
-                    if len(digit_str) == 9:
-                        formatted = f"{digit_str[0:2]} {digit_str[2:5]} {digit_str[5:7]} {digit_str[7:9]}"
-                    else:
-                        formatted = f"{digit_str[0:2]} {digit_str[2:5]} {digit_str[5:8]}"
-                    result.append(formatted)
-                    i = j
-                    continue
-            
-            # Not a phone number, process normally
-            result.append(words[i])
-            i += 1
-        
-        return ' '.join(result)
+            handled = self._handle_phone(words, i)
+            if handled is not None:
+                token, i = handled
+                result.append(token)
+            else:
+                result.append(words[i])
+                i += 1
+        # Keep the whitespace the match swallowed after its last word
+        return ' '.join(result) + span[len(stripped):]
 
     def normalize_data(self, text: str) -> str:
         """Normalize data quantities like 'cinq giga' -> '5Go'"""
-        pattern = r'\b(.*?)\s+(go|mo|giga|mega|gigaoctets?|megaoctets?)\b'
-        
-        def replace_data(match):
-            quantity = match.group(1).strip()
-            unit = match.group(2).lower()
-            
-            # Convert quantity to number
-            normalized_qty = self.convert_to_number(quantity)
-            
-            # Standardize unit
-            if unit in ['go', 'giga', 'gigaoctets', 'gigaoctet']:
-                unit = 'Go'
-            elif unit in ['mo', 'mega', 'megaoctets', 'megaoctet']:
-                unit = 'Mo'
-            
-            return f"{normalized_qty}{unit}"
-        
-        text = re.sub(pattern, replace_data, text, flags=re.IGNORECASE)
-        
-        # Handle per month patterns
-        text = re.sub(r'(\d+)(Go|Mo)\s*/\s*mois', r'\1\2/mois', text)
-        text = re.sub(r'(\d+)(Go|Mo)\s+par\s+mois', r'\1\2/mois', text)
-        
-        return text
+        text = text.lower()
+        return ' '.join(self._scan(text, (self._handle_data, self._handle_per_month)))
 
     def normalize_currency(self, text: str) -> str:
         """Normalize currency amounts with proper formatting"""
-        patterns = [
-            (r'\b(.*?)\s+(francs?\s+cfa|fcfa)\b', 'FCFA'),
-            (r'\b(.*?)\s+francs?\b', 'F'),
-            (r'\b(.*?)\s+f\b', 'F'),
-        ]
-        
-        for pattern, currency in patterns:
-            def replace_currency(match):
-                amount = match.group(1).strip()
-                
-                # Convert amount to number
-                if "dërëm" in amount:
-                    # Special handling for dërëm
-                    words = amount.split()
-                    if words[-1] == "dërëm" and len(words) > 1:
-                        # Get the number before dërëm
-                        num_part = ' '.join(words[:-1])
-                        base_num = self.convert_to_number(num_part)
-                        if base_num.isdigit():
-                            normalized = str(int(base_num) * 5)
-                        else:
-                            normalized = amount
-                    else:
-                        normalized = self.convert_to_number(amount)
-                else:
-                    # Process the amount text as a whole
-                    normalized = self.convert_to_number(amount)
-                
-                # Format large numbers with spaces
-                if normalized.isdigit() and len(normalized) >= 4:
-                    formatted = self._format_with_spaces(normalized)
-                    return f"{formatted} {currency}"
-                return f"{normalized} {currency}"
-            
-            text = re.sub(pattern, replace_currency, text, flags=re.IGNORECASE)
-        
-        return text
+        text = text.lower()
+        return ' '.join(self._scan(text, (self._handle_currency,)))
 
     def _format_with_spaces(self, number_str: str) -> str:
         """Add spaces every 3 digits from right"""
-        if len(number_str) <= 3:
-            return number_str
-        
-        # Reverse, add spaces, reverse again
-        reversed_str = number_str[::-1]
-        spaced = ' '.join([reversed_str[i:i+3] for i in range(0, len(reversed_str), 3)])
-        return spaced[::-1]
+        # The C-level thousands formatter is much faster than reversing and
+        # re-slicing the string in Python
+        return format(int(number_str), ',').replace(',', ' ')
 
     def __call__(self, text: str) -> str:
-        """Main normalization pipeline"""
-        # Step 1: Normalize service codes first
-        text = self.normalize_codes(text)
-        
-        # Step 2: Normalize phone numbers
+        """Main normalization pipeline: a regex phone pass, then one word scan"""
+        # Lowercase once up front; every handler then works in a single case
+        # instead of lowercasing substrings as it goes
+        text = text.lower()
         text = self.normalize_phone_numbers(text)
-        
-        # Step 3: Apply other normalizations
-        text = self.normalize_data(text)
-        
-        # Step 4: Special handling for currency to ensure multiplication works
-        # Process the text word by word, looking for patterns like "number word(s) currency"
-        words = text.split()
-        result = []
-        i = 0
-        
-        while i < len(words):
-            # Check if this could be start of a currency amount
-            if i < len(words) - 1:
-                # Look ahead for currency markers
-                currency_found = False
-                currency_idx = -1
-                currency_type = ""
-                
-                # Check next few words for currency markers
-                for j in range(i + 1, min(i + 6, len(words))):
-                    if words[j].lower() in ["francs", "franc", "f"]:
-                        currency_found = True
-                        currency_idx = j
-                        currency_type = "F"
-                        break
-                    elif words[j].lower() in ["fcfa"] or (j < len(words) - 1 and words[j].lower() == "francs" and words[j+1].lower() == "cfa"):
-                        currency_found = True
-                        currency_idx = j
-                        currency_type = "FCFA"
-                        if words[j].lower() == "francs":
-                            currency_idx = j + 1  # Skip "cfa" too
-                        break
-                
-                if currency_found:
-                    # Extract the amount part
-                    amount_text = " ".join(words[i:currency_idx])
-                    
-                    # Convert to number
-                    if "dërëm" in amount_text:
-                        # Special handling for dërëm
-                        parts = amount_text.split()
-                        if parts[-1] == "dërëm" and len(parts) > 1:
-                            num_part = ' '.join(parts[:-1])
-                            base_num = self.convert_to_number(num_part)
-                            if base_num.isdigit():
-                                normalized = str(int(base_num) * 5)
-                            else:
-                                normalized = amount_text
-                        else:
-                            normalized = self.convert_to_number(amount_text)
-                    else:
-                        normalized = self.convert_to_number(amount_text)
-                    
-                    # Format large numbers
-                    if normalized.isdigit() and len(normalized) >= 4:
-                        formatted = self._format_with_spaces(normalized)
-                        result.append(f"{formatted} {currency_type}")
-                    else:
-                        result.append(f"{normalized} {currency_type}")
-                    
-                    # Skip to after currency marker
-                    i = currency_idx + 1
-                    if currency_type == "FCFA" and currency_idx < len(words) and words[currency_idx-1].lower() == "francs":
-                        i = currency_idx + 1  # Skip "cfa"
-                    continue
-            
-            # Not currency, just add the word
-            result.append(words[i])
-            i += 1
-        
-        text = ' '.join(result)
-        
-        # Step 5: Clean up
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
\ No newline at end of file
+        # The scanner's tokens are whitespace-clean, so joining them is the
+        # whole cleanup; no trailing regex pass needed
+        return ' '.join(self._scan(text))
+
+    def normalize_many(self, texts: List[str], workers: Optional[int] = None) -> List[str]:
+        """
+        Normalize a batch of texts, optionally across processes.
+
+        Normalization is pure CPU work on independent strings, so large
+        batches are spread over a process pool; the instance holds no state
+        (every table is a module-level constant), which makes it trivially
+        picklable for the workers. Small batches and ``workers <= 1`` run
+        serially, where pool startup would cost more than it saves.
+        """
+        if (workers is not None and workers <= 1) or len(texts) < 256:
+            return [self(text) for text in texts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self, texts, chunksize=64))
@@ -17,6 +17,7 @@ import unittest
 import numpy as np
 
 from transformers.models.whisper import WhisperTokenizer, WhisperTokenizerFast
+from transformers.models.whisper.orange_voice_normalizer import SenegalVoiceNormalizer
 from transformers.models.whisper.tokenization_whisper import _combine_tokens_into_words, _find_longest_common_sequence
 from transformers.testing_utils import require_flax, require_tf, require_torch, slow
 
@@ -614,3 +615,31 @@ class SpeechToTextTokenizerMultilinguialTest(unittest.TestCase):
         torch_tensor = torch.tensor(test_list)
         self.assertListEqual(WhisperTokenizer._convert_to_list(torch_tensor), test_list)
         self.assertListEqual(WhisperTokenizerFast._convert_to_list(torch_tensor), test_list)
+
+
+class SenegalVoiceNormalizerTest(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = SenegalVoiceNormalizer()
+
+    def test_preformatted_data_token_keeps_unit_casing(self):
+        # Pre-formatted tokens like "5Go" must survive the lowercase pass with
+        # their canonical unit casing, with or without a "par mois" to fuse
+        self.assertEqual(self.normalizer("5Go par mois"), "5Go/mois")
+        self.assertEqual(self.normalizer("10Mo par mois"), "10Mo/mois")
+        self.assertEqual(self.normalizer("10Mo"), "10Mo")
+        self.assertEqual(self.normalizer("forfait 5Go activé"), "forfait 5Go activé")
+        # Normalized output must be a fixed point: stored transcripts get
+        # re-normalized by the tokenizer
+        self.assertEqual(self.normalizer(self.normalizer("cinq giga")), "5Go")
+
+    def test_spoken_data_quantity(self):
+        self.assertEqual(self.normalizer("cinq giga par mois"), "5Go/mois")
+        self.assertEqual(self.normalizer("cent cinquante mega"), "150Mo")
+
+    def test_stage_entry_points_are_case_insensitive(self):
+        # The per-stage methods are public API and must lowercase for
+        # themselves; only the main pipeline lowercases up front
+        self.assertEqual(self.normalizer.normalize_codes("Tapez Dièse 205 Dièse"), "#205#")
+        self.assertEqual(self.normalizer.normalize_data("Cinq Giga"), "5Go")
+        self.assertEqual(self.normalizer.normalize_currency("Vingt Mille Francs"), "20 000 F")
+        self.assertEqual(self.normalizer.convert_to_number("Cinq"), "5")